@@ -71,6 +71,10 @@ setuptools.setup(
         'tensorflowjs/op_list': ['*.json']
     },
     install_requires=_get_requirements('requirements.txt'),
+    extras_require={
+        # Optional, faster decoding of TensorFlow.js model.json files.
+        'orjson': ['orjson; python_version >= "3.6"'],
+    },
     entry_points={
         'console_scripts': CONSOLE_SCRIPTS,
     },
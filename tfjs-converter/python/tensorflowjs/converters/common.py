@@ -13,6 +13,9 @@
 # limitations under the License.
 # ==============================================================================
 
+import os
+import stat
+
 from tensorflowjs import version
 
 
@@ -34,3 +37,19 @@ CONVERTED_BY_KEY = 'convertedBy'
 def get_converted_by():
   """Get the convertedBy string for storage in model artifacts."""
   return 'TensorFlow.js Converter v%s' % version.version
+
+
+def get_path_kind(path):
+  """Get the kind of file-system entry a path points to, with a single stat.
+
+  Args:
+    path: Path to a file or directory.
+
+  Returns:
+    A `tuple` of three bools: (exists, is_dir, is_file).
+  """
+  try:
+    mode = os.stat(path).st_mode
+  except OSError:
+    return False, False, False
+  return True, stat.S_ISDIR(mode), stat.S_ISREG(mode)
@@ -0,0 +1,56 @@
+# Copyright 2019 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Unit tests for the common converter utilities."""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from tensorflowjs.converters import common
+
+
+class GetPathKindTest(unittest.TestCase):
+
+  def setUp(self):
+    self._tmp_dir = tempfile.mkdtemp()
+    super(GetPathKindTest, self).setUp()
+
+  def tearDown(self):
+    if os.path.isdir(self._tmp_dir):
+      shutil.rmtree(self._tmp_dir)
+    super(GetPathKindTest, self).tearDown()
+
+  def testNonexistentPath(self):
+    self.assertEqual(
+        (False, False, False),
+        common.get_path_kind(os.path.join(self._tmp_dir, 'nonexistent')))
+
+  def testDirectory(self):
+    self.assertEqual((True, True, False), common.get_path_kind(self._tmp_dir))
+
+  def testFile(self):
+    file_path = os.path.join(self._tmp_dir, 'model.h5')
+    with open(file_path, 'wb') as f:
+      f.write(b'foo')
+    self.assertEqual((True, False, True), common.get_path_kind(file_path))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -19,23 +19,25 @@ from __future__ import division
 from __future__ import print_function
 
 import argparse
-import json
 import os
 import shutil
 import sys
 import tempfile
 
 import h5py
-import numpy as np
 import tensorflow as tf
 from tensorflow import keras
 
 from tensorflowjs import quantization
 from tensorflowjs import version
+from tensorflowjs.converters import common
 from tensorflowjs.converters import keras_h5_conversion as conversion
 from tensorflowjs.converters import keras_tfjs_loader
 from tensorflowjs.converters import tf_saved_model_conversion_v2
 
+_KERAS_INPUT_FORMATS = frozenset(['keras', 'keras_saved_model'])
+_TF_INPUT_FORMATS = frozenset(['tf_saved_model', 'tf_hub'])
+
 
 def dispatch_keras_h5_to_tfjs_layers_model_conversion(
     h5_path, output_dir=None, quantization_dtype=None,
@@ -70,9 +72,10 @@ def dispatch_keras_h5_to_tfjs_layers_model_conversion(
         will be `None`.
       groups: an array of weight_groups as defined in tfjs weights_writer.
   """
-  if not os.path.exists(h5_path):
+  h5_path_exists, h5_path_is_dir, _ = common.get_path_kind(h5_path)
+  if not h5_path_exists:
     raise ValueError('Nonexistent path to HDF5 file: %s' % h5_path)
-  if os.path.isdir(h5_path):
+  if h5_path_is_dir:
     raise ValueError(
         'Expected path to point to an HDF5 file, but it points to a '
         'directory: %s' % h5_path)
@@ -87,10 +90,11 @@ def dispatch_keras_h5_to_tfjs_layers_model_conversion(
         h5_file, split_by_layer=split_weights_by_layer)
 
   if output_dir:
-    if os.path.isfile(output_dir):
+    _, output_dir_is_dir, output_dir_is_file = common.get_path_kind(output_dir)
+    if output_dir_is_file:
       raise ValueError(
           'Output path "%s" already exists as a file' % output_dir)
-    if not os.path.isdir(output_dir):
+    if not output_dir_is_dir:
       os.makedirs(output_dir)
     conversion.write_artifacts(
         model_json, groups, output_dir, quantization_dtype,
@@ -118,9 +122,10 @@ def dispatch_keras_h5_to_tfjs_graph_model_conversion(
     strip_debug_ops: Bool whether to allow unsupported debug ops.
   """
 
-  if not os.path.exists(h5_path):
+  h5_path_exists, h5_path_is_dir, _ = common.get_path_kind(h5_path)
+  if not h5_path_exists:
     raise ValueError('Nonexistent path to HDF5 file: %s' % h5_path)
-  if os.path.isdir(h5_path):
+  if h5_path_is_dir:
     raise ValueError(
         'Expected path to point to an HDF5 file, but it points to a '
         'directory: %s' % h5_path)
@@ -209,14 +214,13 @@ def dispatch_tensorflowjs_to_keras_h5_conversion(config_json_path, h5_path):
         'but received an existing directory (%s).' % h5_path)
 
   # Verify that config_json_path points to a JSON file.
-  with open(config_json_path, 'rt') as f:
-    try:
-      json.load(f)
-    except (ValueError, IOError):
-      raise ValueError(
-          'For input_type=tfjs_layers_model & output_format=keras, '
-          'the input path is expected to contain valid JSON content, '
-          'but cannot read valid JSON content from %s.' % config_json_path)
+  try:
+    keras_tfjs_loader.load_json_file(config_json_path)
+  except (ValueError, IOError):
+    raise ValueError(
+        'For input_type=tfjs_layers_model & output_format=keras, '
+        'the input path is expected to contain valid JSON content, '
+        'but cannot read valid JSON content from %s.' % config_json_path)
 
   with tf.Graph().as_default(), tf.compat.v1.Session():
     model = keras_tfjs_loader.load_keras_model(config_json_path)
@@ -243,14 +247,13 @@ def dispatch_tensorflowjs_to_keras_saved_model_conversion(
         'file, but received a directory.')
 
   # Verify that config_json_path points to a JSON file.
-  with open(config_json_path, 'rt') as f:
-    try:
-      json.load(f)
-    except (ValueError, IOError):
-      raise ValueError(
-          'For input_type=tfjs_layers_model & output_format=keras, '
-          'the input path is expected to contain valid JSON content, '
-          'but cannot read valid JSON content from %s.' % config_json_path)
+  try:
+    keras_tfjs_loader.load_json_file(config_json_path)
+  except (ValueError, IOError):
+    raise ValueError(
+        'For input_type=tfjs_layers_model & output_format=keras, '
+        'the input path is expected to contain valid JSON content, '
+        'but cannot read valid JSON content from %s.' % config_json_path)
 
   with tf.Graph().as_default(), tf.compat.v1.Session():
     model = keras_tfjs_loader.load_keras_model(config_json_path)
@@ -290,20 +293,18 @@ def dispatch_tensorflowjs_to_tensorflowjs_conversion(
   # a directory (not a file).
 
   # Verify that config_json_path points to a JSON file.
-  with open(config_json_path, 'rt') as f:
-    try:
-      json.load(f)
-    except (ValueError, IOError):
-      raise ValueError(
-          'For input_type=tfjs_layers_model, '
-          'the input path is expected to contain valid JSON content, '
-          'but cannot read valid JSON content from %s.' % config_json_path)
+  try:
+    keras_tfjs_loader.load_json_file(config_json_path)
+  except (ValueError, IOError):
+    raise ValueError(
+        'For input_type=tfjs_layers_model, '
+        'the input path is expected to contain valid JSON content, '
+        'but cannot read valid JSON content from %s.' % config_json_path)
 
   temp_h5_path = tempfile.mktemp(suffix='.h5')
   with tf.Graph().as_default(), tf.compat.v1.Session():
     model = keras_tfjs_loader.load_keras_model(config_json_path)
     model.save(temp_h5_path)
-    dispatch_tensorflowjs_to_keras_h5_conversion(config_json_path, temp_h5_path)
 
   with tf.Graph().as_default(), tf.compat.v1.Session():
     dispatch_keras_h5_to_tfjs_layers_model_conversion(
@@ -352,14 +353,13 @@ def dispatch_tfjs_layers_model_to_tfjs_graph_conversion(
   # a directory (not a file).
 
   # Verify that config_json_path points to a JSON file.
-  with open(config_json_path, 'rt') as f:
-    try:
-      json.load(f)
-    except (ValueError, IOError):
-      raise ValueError(
-          'For input_type=tfjs_layers_model, '
-          'the input path is expected to contain valid JSON content, '
-          'but cannot read valid JSON content from %s.' % config_json_path)
+  try:
+    keras_tfjs_loader.load_json_file(config_json_path)
+  except (ValueError, IOError):
+    raise ValueError(
+        'For input_type=tfjs_layers_model, '
+        'the input path is expected to contain valid JSON content, '
+        'but cannot read valid JSON content from %s.' % config_json_path)
 
   temp_h5_path = tempfile.mktemp(suffix='.h5')
 
@@ -394,10 +394,8 @@ def _standardize_input_output_formats(input_format, output_format):
         '--input_format=tensorflowjs has been deprecated. '
         'Use --input_format=tfjs_layers_model instead.')
 
-  input_format_is_keras = (
-      input_format in ['keras', 'keras_saved_model'])
-  input_format_is_tf = (
-      input_format in ['tf_saved_model', 'tf_hub'])
+  input_format_is_keras = input_format in _KERAS_INPUT_FORMATS
+  input_format_is_tf = input_format in _TF_INPUT_FORMATS
   if output_format is None:
     # If no explicit output_format is provided, infer it from input format.
     if input_format_is_keras:
@@ -427,12 +425,9 @@ def _standardize_input_output_formats(input_format, output_format):
 def _parse_quantization_bytes(quantization_bytes):
   if quantization_bytes is None:
     return None
-  elif quantization_bytes == 1:
-    return np.uint8
-  elif quantization_bytes == 2:
-    return np.uint16
-  else:
+  if quantization_bytes not in quantization.QUANTIZATION_BYTES_TO_DTYPES:
     raise ValueError('Unsupported quantization bytes: %s' % quantization_bytes)
+  return quantization.QUANTIZATION_BYTES_TO_DTYPES[quantization_bytes]
 
 
 def get_arg_parser():
@@ -335,9 +335,11 @@ def save_keras_model(model, artifacts_dir, quantization_dtype=None):
   model.save(temp_h5_path)
   topology_json, weight_groups = (
       h5_merged_saved_model_to_tfjs_format(temp_h5_path))
-  if os.path.isfile(artifacts_dir):
+  _, artifacts_dir_is_dir, artifacts_dir_is_file = common.get_path_kind(
+      artifacts_dir)
+  if artifacts_dir_is_file:
     raise ValueError('Path "%s" already exists as a file.' % artifacts_dir)
-  if not os.path.isdir(artifacts_dir):
+  if not artifacts_dir_is_dir:
     os.makedirs(artifacts_dir)
   write_artifacts(
       topology_json, weight_groups, artifacts_dir,
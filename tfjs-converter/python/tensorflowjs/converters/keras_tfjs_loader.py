@@ -29,6 +29,37 @@ from tensorflow import keras
 from tensorflowjs import read_weights
 from tensorflowjs.converters import keras_h5_conversion
 
+try:
+  # orjson is an optional, faster JSON decoder. Fall back to the standard
+  # library json module if it is not installed.
+  import orjson  # pylint: disable=import-error
+except ImportError:
+  orjson = None
+
+
+def load_json_file(json_path):
+  """Reads and parses a JSON file, using orjson if it is available.
+
+  Args:
+    json_path: Path to the JSON file.
+
+  Returns:
+    The parsed JSON content.
+
+  Raises:
+    ValueError, if the file does not contain valid JSON content.
+  """
+  with open(json_path, 'rb') as f:
+    content = f.read()
+  if orjson is not None:
+    try:
+      return orjson.loads(content)
+    except ValueError:
+      # orjson is stricter than the json module (e.g., it rejects NaN and
+      # integers that do not fit in 64 bits), so retry with the latter.
+      pass
+  return json.loads(tf.compat.as_text(content))
+
 
 def _deserialize_keras_model(model_topology_json,
                              weight_entries=None,
@@ -52,17 +83,12 @@ def _deserialize_keras_model(model_topology_json,
     model_topology_json = json.loads(tf.compat.as_text(model_topology_json))
   elif not isinstance(model_topology_json, dict):
     model_topology_json = json.load(model_topology_json)
-  is_tf_keras = ('keras_version' in model_topology_json and
-                 model_topology_json['keras_version'].endswith('-tf'))
 
   if 'model_config' in model_topology_json:
     model_topology_json = model_topology_json['model_config']
   unique_name_scope = uuid.uuid4().hex if use_unique_name_scope else None
   with tf.compat.v1.name_scope(unique_name_scope):
-    if is_tf_keras:
-      model = keras.models.model_from_json(json.dumps(model_topology_json))
-    else:
-      model = keras.models.model_from_json(json.dumps(model_topology_json))
+    model = keras.models.model_from_json(json.dumps(model_topology_json))
 
   if weight_entries:
     weights_dict = dict()
@@ -189,9 +215,8 @@ def load_keras_model(config_json_path,
         'The arguments weights_data_buffers and weights_path_prefix are '
         'mutually exclusive and should not be both specified.')
 
-  with open(config_json_path, 'rt') as f:
-    config_json = json.load(f)
-    _check_config_json(config_json)
+  config_json = load_json_file(config_json_path)
+  _check_config_json(config_json)
 
   weight_entries = None
   if load_weights:
@@ -445,6 +445,65 @@ class LoadKerasModelTest(tf.test.TestCase):
       self.assertAllClose(
           predict_out, model2.predict([input1_val, input2_val]))
 
+  def _addNonStrictJsonFieldsToModelJson(self, model_json_path):
+    """Adds fields that the standard json module accepts but orjson rejects."""
+    with open(model_json_path, 'rt') as f:
+      model_json = json.load(f)
+    model_json['nanField'] = float('nan')
+    model_json['hugeIntegerField'] = 2 ** 70
+    with open(model_json_path, 'wt') as f:
+      json.dump(model_json, f)
+
+  @unittest.skipIf(keras_tfjs_loader.orjson is None, 'orjson is not installed')
+  def testLoadKerasModelWithNaNAndHugeIntegerInJSONWithOrjson(self):
+    with tf.Graph().as_default(), tf.compat.v1.Session():
+      tfjs_path = os.path.join(self._tmp_dir, 'model_for_test')
+      model1 = self._saveKerasModelForTest(tfjs_path)
+      model1_weight_values = model1.get_weights()
+
+    model_json_path = os.path.join(tfjs_path, 'model.json')
+    self._addNonStrictJsonFieldsToModelJson(model_json_path)
+    # Make sure the content exercises the fallback to the json module.
+    with open(model_json_path, 'rb') as f:
+      with self.assertRaises(ValueError):
+        keras_tfjs_loader.orjson.loads(f.read())
+
+    with tf.Graph().as_default(), tf.compat.v1.Session():
+      model2 = keras_tfjs_loader.load_keras_model(model_json_path)
+      model2_weight_values = model2.get_weights()
+      self.assertEqual(len(model1_weight_values), len(model2_weight_values))
+      for model1_weight_value, model2_weight_value in zip(
+          model1_weight_values, model2_weight_values):
+        self.assertAllClose(model1_weight_value, model2_weight_value)
+      self.assertEqual(model1.to_json(), model2.to_json())
+
+  def testLoadKerasModelWithoutOrjson(self):
+    with tf.Graph().as_default(), tf.compat.v1.Session():
+      tfjs_path = os.path.join(self._tmp_dir, 'model_for_test')
+      model1 = self._saveKerasModelForTest(tfjs_path)
+      model1_weight_values = model1.get_weights()
+
+    model_json_path = os.path.join(tfjs_path, 'model.json')
+    self._addNonStrictJsonFieldsToModelJson(model_json_path)
+
+    orjson = keras_tfjs_loader.orjson
+    keras_tfjs_loader.orjson = None
+    try:
+      model_json = keras_tfjs_loader.load_json_file(model_json_path)
+      self.assertTrue(np.isnan(model_json['nanField']))
+      self.assertEqual(2 ** 70, model_json['hugeIntegerField'])
+
+      with tf.Graph().as_default(), tf.compat.v1.Session():
+        model2 = keras_tfjs_loader.load_keras_model(model_json_path)
+        model2_weight_values = model2.get_weights()
+        self.assertEqual(len(model1_weight_values), len(model2_weight_values))
+        for model1_weight_value, model2_weight_value in zip(
+            model1_weight_values, model2_weight_values):
+          self.assertAllClose(model1_weight_value, model2_weight_value)
+        self.assertEqual(model1.to_json(), model2.to_json())
+    finally:
+      keras_tfjs_loader.orjson = orjson
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -46,6 +46,13 @@ CLEARED_TENSOR_FIELDS = (
 
 _HUB_V1_MODULE_PB = "tfhub_module.pb"
 
+_OP_LIST_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '../op_list/')
+
+# Debug ops that are allowed when `strip_debug_ops` is set, since Grappler's
+# debug stripper removes them from the graph.
+_DEBUG_OPS = frozenset(['Assert', 'CheckNumerics', 'Print'])
+
 def load_graph(graph_filename):
   """Loads GraphDef. Returns Python Graph object.
 
@@ -71,6 +78,31 @@ def get_cluster():
   cluster = gcluster.Cluster(devices=[named_device])
   return cluster
 
+# Cache of supported TensorFlow op names, keyed by op list directory.
+_SUPPORTED_OP_NAMES = {}
+
+def _get_supported_op_names(op_list_path):
+  """Reads the names of the ops supported by TensorFlow.js.
+
+  The op list directory is scanned only once; subsequent calls with the same
+  directory return the cached result.
+
+  Args:
+    op_list_path: string Path to the directory holding the op list JSON files.
+
+  Returns:
+    A `frozenset` of supported TensorFlow op names.
+  """
+  op_list_path = os.path.realpath(op_list_path)
+  if op_list_path not in _SUPPORTED_OP_NAMES:
+    names = set()
+    for filename in os.listdir(op_list_path):
+      if os.path.splitext(filename)[1] == '.json':
+        with open(os.path.join(op_list_path, filename)) as json_data:
+          names.update(x['tfOpName'] for x in json.load(json_data))
+    _SUPPORTED_OP_NAMES[op_list_path] = frozenset(names)
+  return _SUPPORTED_OP_NAMES[op_list_path]
+
 def validate(nodes, skip_op_check, strip_debug_ops):
   """Validate if the node's op is compatible with TensorFlow.js.
 
@@ -81,18 +113,10 @@ def validate(nodes, skip_op_check, strip_debug_ops):
   """
   if skip_op_check:
     return set()
-  ops = []
-  op_list_path = os.path.join(
-      os.path.dirname(os.path.abspath(__file__)), '../op_list/')
-  for filename in os.listdir(op_list_path):
-    if os.path.splitext(filename)[1] == '.json':
-      with open(os.path.join(op_list_path, filename)) as json_data:
-        ops += json.load(json_data)
-
-  names = {x['tfOpName'] for x in ops}
+  names = _get_supported_op_names(_OP_LIST_PATH)
   if strip_debug_ops:
-    names = names.union({'Assert', 'CheckNumerics', 'Print'})
-  not_supported = {x.op for x in [x for x in nodes if x.op not in names]}
+    names = names | _DEBUG_OPS
+  not_supported = {x.op for x in nodes if x.op not in names}
   return not_supported
 
 def optimize_graph(graph, output_node_names, output_graph, tf_version,
@@ -174,9 +198,16 @@ def extract_weights(graph_def,
   graph = tf.Graph()
   with tf.compat.v1.Session(graph=graph) as sess:
     tf.import_graph_def(graph_def, name='')
+    # The session graph holds its own copy of the constants now, so remove the
+    # binary arrays from the GraphDef before the weights are evaluated. This
+    # keeps the tensor bytes from being held twice while they are fetched.
     for const in constants:
-      tensor = graph.get_tensor_by_name(const.name + ':0')
-      value = tensor.eval(session=sess)
+      for field_name in CLEARED_TENSOR_FIELDS:
+        const.attr["value"].tensor.ClearField(field_name)
+
+    # Evaluate all the constants in a single run instead of one per constant.
+    values = sess.run([const.name + ':0' for const in constants])
+    for const, value in zip(constants, values):
       if not isinstance(value, np.ndarray):
         value = np.array(value)
 
@@ -185,10 +216,6 @@ def extract_weights(graph_def,
       # Restore the conditional inputs
       const.input[:] = const_inputs[const.name]
 
-      # Remove the binary array from tensor and save it to the external file.
-      for field_name in CLEARED_TENSOR_FIELDS:
-        const.attr["value"].tensor.ClearField(field_name)
-
   write_artifacts(MessageToDict(graph_def), [const_manifest], output_graph,
                   tf_version, quantization_dtype=quantization_dtype)
 
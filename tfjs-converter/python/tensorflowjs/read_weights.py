@@ -18,8 +18,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import io
 import os
+import struct
 
 import numpy as np
 from tensorflowjs import quantization
@@ -30,6 +30,8 @@ _INPUT_DTYPES = [np.float32, np.int32, np.uint8, np.uint16, np.object]
 STRING_LENGTH_NUM_BYTES = 4
 # The data type used to encode the length of a string in a string tensor.
 STRING_LENGTH_DTYPE = np.dtype('uint32').newbyteorder('<')
+# Struct matching `STRING_LENGTH_DTYPE`, used to decode the string lengths.
+_STRING_LENGTH_STRUCT = struct.Struct('<I')
 
 def read_weights(weights_manifest, base_path, flatten=False):
   """Load weight values according to a TensorFlow.js weights manifest.
@@ -63,14 +65,11 @@ def read_weights(weights_manifest, base_path, flatten=False):
 
   data_buffers = []
   for group in weights_manifest:
-    buff = io.BytesIO()
-    buff_writer = io.BufferedWriter(buff)
+    shard_buffers = []
     for path in group['paths']:
       with open(os.path.join(base_path, path), 'rb') as f:
-        buff_writer.write(f.read())
-    buff_writer.flush()
-    buff_writer.seek(0)
-    data_buffers.append(buff.read())
+        shard_buffers.append(f.read())
+    data_buffers.append(b''.join(shard_buffers))
   return decode_weights(weights_manifest, data_buffers, flatten=flatten)
 
 
@@ -104,9 +103,7 @@ def _deserialize_string_array(data_buffer, offset, shape):
             offset + STRING_LENGTH_NUM_BYTES)
   vals = []
   for _ in range(size):
-    byte_length = np.frombuffer(
-        data_buffer[offset:offset + STRING_LENGTH_NUM_BYTES],
-        STRING_LENGTH_DTYPE)[0]
+    byte_length, = _STRING_LENGTH_STRUCT.unpack_from(data_buffer, offset)
     offset += STRING_LENGTH_NUM_BYTES
     string = data_buffer[offset:offset + byte_length]
     vals.append(string)
@@ -171,7 +168,9 @@ def decode_weights(weights_manifest, data_buffers, flatten=False):
     for weight in group['weights']:
       quant_info = weight.get('quantization', None)
       name = weight['name']
-      if weight['dtype'] == 'string':
+      weight_dtype = weight['dtype']
+      is_string = weight_dtype == 'string'
+      if is_string:
         # String array.
         dtype = np.object
       elif quant_info:
@@ -179,11 +178,11 @@ def decode_weights(weights_manifest, data_buffers, flatten=False):
         dtype = np.dtype(quant_info['dtype'])
       else:
         # Regular numeric array.
-        dtype = np.dtype(weight['dtype'])
+        dtype = np.dtype(weight_dtype)
       shape = weight['shape']
       if dtype not in _INPUT_DTYPES:
         raise NotImplementedError('Unsupported data type: %s' % dtype)
-      if weight['dtype'] == 'string':
+      if is_string:
         value, offset = _deserialize_string_array(data_buffer, offset, shape)
       else:
         value = _deserialize_numeric_array(data_buffer, offset, dtype, shape)
@@ -191,7 +190,7 @@ def decode_weights(weights_manifest, data_buffers, flatten=False):
       if quant_info:
         value = quantization.dequantize_weights(
             value, quant_info['scale'], quant_info['min'],
-            np.dtype(weight['dtype']))
+            np.dtype(weight_dtype))
       out_group.append({'name': name, 'data': value})
 
     if flatten:
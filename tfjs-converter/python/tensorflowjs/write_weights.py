@@ -203,18 +203,14 @@ def _serialize_string_array(data):
   """
   strings = data.flatten().tolist()
 
-  string_bytes = io.BytesIO()
-  bytes_writer = io.BufferedWriter(string_bytes)
-
+  string_bytes = []
   for x in strings:
     encoded = x if isinstance(x, bytes) else x.encode('utf-8')
     length_as_bytes = np.array(len(encoded),
                                read_weights.STRING_LENGTH_DTYPE).tobytes()
-    bytes_writer.write(length_as_bytes)
-    bytes_writer.write(encoded)
-  bytes_writer.flush()
-  string_bytes.seek(0)
-  return string_bytes.read()
+    string_bytes.append(length_as_bytes)
+    string_bytes.append(encoded)
+  return b''.join(string_bytes)
 
 def _serialize_numeric_array(data):
   """Serializes a numeric numpy array into bytes.
@@ -307,22 +303,23 @@ def _get_weights_manifest_for_group(group):
   """
   weights_entries = []
   for entry in group:
-    is_quantized = 'quantization' in entry
-    dtype = (entry['quantization']['original_dtype']
-             if is_quantized else entry['data'].dtype.name)
+    data = entry['data']
+    quant_info = entry.get('quantization', None)
+    data_dtype = data.dtype.name
+    dtype = quant_info['original_dtype'] if quant_info else data_dtype
     var_manifest = {
         'name': entry['name'],
-        'shape': list(entry['data'].shape),
+        'shape': list(data.shape),
         'dtype': dtype
     }
     # String arrays have dtype 'object' and need extra metadata to parse.
     if dtype == 'object':
       var_manifest['dtype'] = 'string'
-    if is_quantized:
+    if quant_info:
       var_manifest['quantization'] = {
-          'min': entry['quantization']['min'],
-          'scale': entry['quantization']['scale'],
-          'dtype': entry['data'].dtype.name
+          'min': quant_info['min'],
+          'scale': quant_info['scale'],
+          'dtype': data_dtype
       }
     weights_entries.append(var_manifest)
   return weights_entries
@@ -359,7 +356,7 @@ def _assert_valid_weight_entry(entry):
 
   # String tensors can be backed by different numpy dtypes, thus we consolidate
   # to a single 'np.object' dtype.
-  if data.dtype.name.startswith('str') or data.dtype.name.startswith('bytes'):
+  if data.dtype.name.startswith(('str', 'bytes')):
     data = data.astype(np.object)
     entry['data'] = data
 